@@ -1,7 +1,7 @@
 """Collection of request and response header value objects."""
 
 import getpass
-from base64 import b64encode
+from binascii import b2a_base64
 from collections import UserDict
 from dataclasses import dataclass
 from enum import Enum
@@ -35,7 +35,7 @@ class BytesHeaderValue:
     def to_json(self) -> Any:
         """Converts object to a JSON serializable object."""
 
-        return b64encode(self.value).decode()
+        return b2a_base64(self.value, newline=False).decode("ascii")
 
 
 @dataclass
@@ -71,6 +71,10 @@ class CompressValue:
         return self.algorithm
 
 
+_CONTENT_LENGTH_CACHE_LIMIT = 4096
+_content_length_cache: dict[int, bytes] = {}
+
+
 @dataclass
 class ContentLengthValue:
     """ContentLength header.  Indicates the length of the body in bytes."""
@@ -81,7 +85,14 @@ class ContentLengthValue:
         return self.length
 
     def __bytes__(self) -> bytes:
-        return str(self.length).encode("ascii")
+        if encoded := _content_length_cache.get(self.length):
+            return encoded
+
+        encoded = str(self.length).encode("ascii")
+        if 0 <= self.length <= _CONTENT_LENGTH_CACHE_LIMIT:
+            _content_length_cache[self.length] = encoded
+
+        return encoded
 
     def to_json(self) -> Any:
         """Converts object to a JSON serializable object."""
@@ -99,6 +110,11 @@ class MessageClassOption(str, Enum):
         return self.value
 
 
+_message_class_bytes = {
+    option: option.name.encode("ascii") for option in MessageClassOption
+}
+
+
 @dataclass
 class MessageClassValue:
     """MessageClass header.  Used to specify whether a message is 'spam' or
@@ -108,7 +124,7 @@ class MessageClassValue:
     value: MessageClassOption = MessageClassOption.ham
 
     def __bytes__(self) -> bytes:
-        return self.value.name.encode("ascii")
+        return _message_class_bytes[self.value]
 
     def to_json(self) -> Any:
         """Converts object to a JSON serializable object."""
@@ -128,6 +144,16 @@ class ActionOption:
     remote: bool = False
 
 
+_set_or_remove_bytes = {
+    # if nothing is set, then return a blank string so the request doesn't get
+    # tainted
+    (False, False): b"",
+    (True, False): b"local",
+    (False, True): b"remote",
+    (True, True): b"local, remote",
+}
+
+
 @dataclass
 class SetOrRemoveValue:
     """Base class for headers that implement "local" and "remote" rules."""
@@ -135,18 +161,7 @@ class SetOrRemoveValue:
     action: ActionOption
 
     def __bytes__(self) -> bytes:
-        if not self.action.local and not self.action.remote:
-            # if nothing is set, then return a blank string so the request
-            # doesn't get tainted
-            return b""
-
-        values = []
-        if self.action.local:
-            values.append(b"local")
-        if self.action.remote:
-            values.append(b"remote")
-
-        return b", ".join(values)
+        return _set_or_remove_bytes[bool(self.action.local), bool(self.action.remote)]
 
     def to_json(self) -> Any:
         """Converts object to a JSON serializable object."""
@@ -165,7 +180,7 @@ class SpamValue:
 
     def __bytes__(self) -> bytes:
         return b"%b ; %.1f / %.1f" % (
-            str(self.value).encode("ascii"),
+            b"True" if self.value else b"False",
             self.score,
             self.threshold,
         )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum, auto
 from typing import Any, Callable, Mapping, Union
 
@@ -23,6 +22,32 @@ from .header_values import (
     UserValue,
 )
 
+_request_verbs = frozenset(
+    [
+        "CHECK",
+        "HEADERS",
+        "PING",
+        "PROCESS",
+        "REPORT_IFSPAM",
+        "REPORT",
+        "SKIP",
+        "SYMBOLS",
+        "TELL",
+    ]
+)
+
+_spam_found_values = {"true": True, "yes": True, "false": False, "no": False}
+
+_set_remove_actions = {
+    "": (False, False),
+    "local": (True, False),
+    "remote": (False, True),
+    "local,remote": (True, True),
+    "remote,local": (True, True),
+}
+
+_message_class_options = {option.name: option for option in MessageClassOption}
+
 
 class States(Enum):
     """States for the parser state machine."""
@@ -62,7 +87,8 @@ class Parser:
         self.result: dict[str, Any] = {"headers": {}, "body": b""}
 
         self._state = start
-        self.buffer = b""
+        self._buffer = b""
+        self._offset = 0
 
         self._logger = logger
 
@@ -84,6 +110,48 @@ class Parser:
 
         return self._state
 
+    @property
+    def buffer(self) -> bytes:
+        """The unconsumed portion of the message.
+
+        :return: Byte string that has not been parsed yet.
+        """
+
+        return self._buffer[self._offset :]
+
+    @buffer.setter
+    def buffer(self, value: bytes) -> None:
+        """Replaces the unconsumed portion of the message.
+
+        :param value: Byte string to parse next.
+        """
+
+        self._buffer = value
+        self._offset = 0
+
+    def _partition(self) -> tuple[bytes, bytes, memoryview, int]:
+        """Splits the unconsumed buffer at the next delimiter without copying the remainder.
+
+        :return: The line, the delimiter if found, a view of the leftover bytes, and the offset where the leftover
+            starts.
+        """
+
+        end = self._buffer.find(self.delimiter, self._offset)
+        if end == -1:
+            line, delimiter, next_offset = (
+                self._buffer[self._offset :],
+                b"",
+                len(self._buffer),
+            )
+        else:
+            line, delimiter, next_offset = (
+                self._buffer[self._offset : end],
+                self.delimiter,
+                end + len(self.delimiter),
+            )
+
+        return line, delimiter, memoryview(self._buffer)[next_offset:], next_offset
+
     def parse(self, stream: bytes) -> Mapping[str, Any]:
         """Entry method to parse a message.
 
@@ -117,10 +185,10 @@ class Parser:
         :raises ParseError: When the :attr:`status_parser` callable experiences an error.
         """
 
-        status_line, delimiter, leftover = self.buffer.partition(self.delimiter)
+        status_line, delimiter, _, next_offset = self._partition()
 
         if status_line and delimiter:
-            self.buffer = leftover
+            self._offset = next_offset
             parsed_status = self.status_parser(status_line)
             self.result = {**self.result, **parsed_status}
             self._state = States.Header
@@ -150,7 +218,7 @@ class Parser:
         :raises ParseError: None of the previous conditions are matched.
         """
 
-        header_line, delimiter, leftover = self.buffer.partition(self.delimiter)
+        header_line, delimiter, leftover, next_offset = self._partition()
 
         if self._at_end_of_headers_with_empty_body(header_line, delimiter, leftover):
             self.buffer = b""
@@ -158,12 +226,12 @@ class Parser:
             self._bind(headers=self.result["headers"])
             self._logger.debug("Finished parsing headers")
         elif self._at_end_of_headers(header_line, delimiter):
-            self.buffer = leftover
+            self._offset = next_offset
             self._state = States.Body
             self._bind(headers=self.result["headers"])
             self._logger.debug("Finished parsing headers")
         elif self._at_next_header(header_line, delimiter):
-            self.buffer = leftover
+            self._offset = next_offset
             key, value = self.header_parser(header_line)
             self.result["headers"][key] = value
             self._logger.debug("Parsed header {}", key)
@@ -174,7 +242,7 @@ class Parser:
             raise ParseError("Header section not in recognizable format")
 
     def _at_end_of_headers_with_empty_body(
-        self, header_line: bytes, delimiter: bytes, leftover: bytes
+        self, header_line: bytes, delimiter: bytes, leftover: Union[bytes, memoryview]
     ) -> bool:
         """Helper method to check if the header sections is done and there is an empty body.
 
@@ -213,7 +281,7 @@ class Parser:
 
     @staticmethod
     def _is_status_line_only(
-        header_line: bytes, delimiter: bytes, leftover: bytes
+        header_line: bytes, delimiter: bytes, leftover: Union[bytes, memoryview]
     ) -> bool:
         """Helper method to check if the response is a status line only, without a header section.
 
@@ -269,17 +337,7 @@ def parse_request_status(stream: bytes) -> dict[str, str]:
             "Could not parse request status line, not in recognizable format"
         ) from error
 
-    if verb not in [
-        "CHECK",
-        "HEADERS",
-        "PING",
-        "PROCESS",
-        "REPORT_IFSPAM",
-        "REPORT",
-        "SKIP",
-        "SYMBOLS",
-        "TELL",
-    ]:
+    if verb not in _request_verbs:
         raise ParseError("Not a valid verb")
 
     if protocol != "SPAMC":
@@ -343,8 +401,8 @@ def parse_message_class_value(
         value = stream
     else:
         try:
-            value = getattr(MessageClassOption, stream.strip())
-        except AttributeError as error:
+            value = _message_class_options[stream.strip()]
+        except KeyError as error:
             raise ParseError("Unable to parse Message-class header value") from error
 
     return MessageClassValue(value=value)
@@ -393,17 +451,12 @@ def parse_set_remove_value(stream: Union[ActionOption, str]) -> SetOrRemoveValue
         value = stream
     else:
         stream = stream.replace(" ", "")
-        values = stream.split(",")
-
-        if "local" in values:
-            local = True
+        if actions := _set_remove_actions.get(stream):
+            local, remote = actions
         else:
-            local = False
-
-        if "remote" in values:
-            remote = True
-        else:
-            remote = False
+            values = stream.split(",")
+            local = "local" in values
+            remote = "remote" in values
 
         value = ActionOption(local=local, remote=remote)
 
@@ -420,19 +473,15 @@ def parse_spam_value(stream: str) -> SpamValue:
     :raises ParseError: Raised if there is no true/false value, or valid numbers for the score or threshold.
     """
 
-    stream = stream.replace(" ", "")
-    try:
-        found, score, threshold = re.split("[;/]", stream)
-    except ValueError as error:
-        raise ParseError("Spam header in unrecognizable format") from error
+    found, found_separator, scores = stream.replace(" ", "").partition(";")
+    score, score_separator, threshold = scores.partition("/")
+    if not found_separator or not score_separator:
+        raise ParseError("Spam header in unrecognizable format")
 
-    found = found.lower()
-    if found in ["true", "yes"]:
-        value = True
-    elif found in ["false", "no"]:
-        value = False
-    else:
-        raise ParseError("Spam header is not a true or false value")
+    try:
+        value = _spam_found_values[found.lower()]
+    except KeyError as error:
+        raise ParseError("Spam header is not a true or false value") from error
 
     try:
         parsed_score = float(score)
@@ -467,14 +516,14 @@ def parse_header_value(header: str, value: Union[str, bytes]) -> Any:
     :return: The :class:`aiospamc.header_values.HeaderValue` instance from the parsing function.
     """
 
-    if header in header_value_parsers:
+    if parser := header_value_parsers.get(header):
         if isinstance(value, bytes):
             try:
-                return header_value_parsers[header](value.decode())
+                return parser(value.decode())
             except UnicodeDecodeError as error:
                 raise ParseError(message="Unable to decode header value") from error
         else:
-            return header_value_parsers[header](value)
+            return parser(value)
     else:
         if isinstance(value, bytes):
             try:
@@ -1,6 +1,7 @@
 import asyncio
 import concurrent.futures
 import datetime
+import re
 import ssl
 import sys
 import threading
@@ -9,7 +10,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from shutil import which
 from socket import gethostbyname
-from subprocess import PIPE, STDOUT, Popen, TimeoutExpired
+from subprocess import PIPE, STDOUT, Popen, TimeoutExpired, run
 
 import pytest
 import trustme
@@ -36,7 +37,7 @@ def x_headers():
     return {"A": GenericHeaderValue(value="a"), "B": GenericHeaderValue(value="b")}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spam():
     """Example spam message using SpamAssassin's GTUBE message."""
 
@@ -313,6 +314,11 @@ def ca_cert_path(ca, tmp_path_factory: pytest.TempdirFactory):
     yield cert_file
 
 
+@pytest.fixture(scope="session")
+def ssl_context(ca_cert_path):
+    yield ssl.create_default_context(cafile=str(ca_cert_path))
+
+
 @pytest.fixture(scope="session")
 def server_cert_and_key(server_cert, tmp_path_factory: pytest.TempdirFactory):
     tmp_path = tmp_path_factory.mktemp("server_certs")
@@ -553,6 +559,20 @@ def spamd_timeout(request):
     yield request.config.getoption("--spamd-process-timeout")
 
 
+@pytest.fixture(scope="session")
+def spamd_major():
+    spamd_exe = which("spamd")
+    if not spamd_exe:
+        pytest.skip("spamd not found")
+
+    process = run([spamd_exe, "--version"], capture_output=True, timeout=5)
+    version = re.search(rb"(\d+)\.\d+\.\d+", process.stdout)
+    if not version:
+        pytest.skip(f"Could not parse spamd version from {process.stdout!r}")
+
+    yield int(version.group(1))
+
+
 @pytest.fixture(scope="session")
 def spamd_common_options():
     yield ["--local", "--allow-tell"]
@@ -600,7 +620,11 @@ def spamd_ssl_client(
     server_key_path,
     ca_cert_path,
     spamd_timeout,
+    spamd_major,
 ):
+    if spamd_major < 4:
+        pytest.skip("Only SpamAssassin 4+ supports client certificate authentication")
+
     port = unused_tcp_port_factory()
     process = spawn_spamd(
         spamd_common_options
@@ -16,6 +16,7 @@ from aiospamc.header_values import (
     SetOrRemoveValue,
     SpamValue,
     UserValue,
+    _content_length_cache,
 )
 
 
@@ -56,6 +57,22 @@ def test_content_length_bytes():
     assert bytes(c) == b"42"
 
 
+@pytest.mark.parametrize("test_input", [0, 42, 4096])
+def test_content_length_bytes_cached(test_input):
+    c = ContentLengthValue(length=test_input)
+
+    assert bytes(c) == str(test_input).encode("ascii")
+    assert _content_length_cache[test_input] is bytes(c)
+
+
+@pytest.mark.parametrize("test_input", [4097, 1_000_000])
+def test_content_length_bytes_not_cached(test_input):
+    c = ContentLengthValue(length=test_input)
+
+    assert bytes(c) == str(test_input).encode("ascii")
+    assert test_input not in _content_length_cache
+
+
 def test_content_length_int():
     c = ContentLengthValue(length=42)
 
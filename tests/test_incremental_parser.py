@@ -98,6 +98,20 @@ def test_header_writes_value(delimiter, mocker):
     assert p.state == States.Header
 
 
+def test_header_consumes_buffer(delimiter, mocker):
+    p = Parser(
+        delimiter=delimiter,
+        status_parser=mocker.stub(),
+        header_parser=mocker.Mock(return_value=("header key", "header value")),
+        body_parser=mocker.stub(),
+        start=States.Header,
+    )
+    p.buffer = b"header key: header value\r\n\r\nright"
+    p.header()
+
+    assert p.buffer == b"\r\nright"
+
+
 def test_header_transitions_to_body_state(delimiter, mocker):
     p = Parser(
         delimiter=delimiter,
@@ -296,9 +310,10 @@ def test_parse_message_class_value_success(test_input, expected):
     assert result.value == expected
 
 
-def test_parse_message_class_value_raises_parseerror():
+@pytest.mark.parametrize("test_input", ["invalid", "mro", "__class__"])
+def test_parse_message_class_value_raises_parseerror(test_input):
     with pytest.raises(ParseError):
-        parse_message_class_value("invalid")
+        parse_message_class_value(test_input)
 
 
 @pytest.mark.parametrize(
@@ -309,6 +324,7 @@ def test_parse_message_class_value_raises_parseerror():
         ["local", True, False],
         ["remote", False, True],
         ["", False, False],
+        ["local, unknown", True, False],
         [ActionOption(local=True, remote=False), True, False],
     ],
 )
@@ -346,6 +362,8 @@ def test_parse_spam_value_success(test_input, value, score, threshold):
     "test_input",
     [
         "Unrecognizable spam",
+        "True ; 40.0",
+        "True / 40.0 ; 20.0",
         "NOTAVALUE ; 40.0 / 20.0",
         "True ; NOTASCORE / 20.0",
         "True ; 40.0 / NOTATHRESHOLD",
@@ -4,6 +4,8 @@ import pytest
 
 import aiospamc
 
+pytestmark = pytest.mark.xdist_group("spamd_tcp")
+
 
 @pytest.mark.integration
 async def test_spam(spamd_tcp, spam):
@@ -2,6 +2,8 @@ import pytest
 
 import aiospamc
 
+pytestmark = pytest.mark.xdist_group("spamd_ssl")
+
 
 @pytest.mark.integration
 async def test_verify_false(spamd_ssl):
@@ -11,78 +13,42 @@ async def test_verify_false(spamd_ssl):
 
 
 @pytest.mark.integration
-async def test_check(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.check(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_headers(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.headers(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
-    )
+@pytest.mark.parametrize(
+    "func",
+    [
+        aiospamc.check,
+        aiospamc.headers,
+        aiospamc.process,
+        aiospamc.report,
+        aiospamc.report_if_spam,
+        aiospamc.symbols,
+    ],
+)
+async def test_functions(func, spamd_ssl, ca_cert_path, spam):
+    result = await func(spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path)
 
     assert 0 == result.status_code
 
 
 @pytest.mark.integration
-async def test_ping(spamd_ssl, ca_cert_path):
+async def test_ping(spamd_ssl, ssl_context):
     result = await aiospamc.ping(
         host=spamd_ssl[0],
         port=spamd_ssl[1],
-        verify=ca_cert_path,
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_process(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.process(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.report(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report_if_spam(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.report_if_spam(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_symbols(spamd_ssl, ca_cert_path, spam):
-    result = await aiospamc.symbols(
-        spam, host=spamd_ssl[0], port=spamd_ssl[1], verify=ca_cert_path
+        verify=ssl_context,
     )
 
     assert 0 == result.status_code
 
 
 @pytest.mark.integration
-async def test_tell(spamd_ssl, ca_cert_path, spam):
+async def test_tell(spamd_ssl, ssl_context, spam):
     result = await aiospamc.tell(
         message=spam,
         message_class="spam",
         host=spamd_ssl[0],
         port=spamd_ssl[1],
-        verify=ca_cert_path,
+        verify=ssl_context,
     )
 
     assert 0 == result.status_code
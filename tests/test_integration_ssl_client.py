@@ -1,52 +1,26 @@
-from shutil import which
-from subprocess import PIPE, Popen
-
 import pytest
 
 import aiospamc
 
-
-def spamd_lt_4():
-    import re
-
-    spamd_exe = which("spamd")
-    if not spamd_exe:
-        return True
-
-    process = Popen([spamd_exe, "--version"], stdout=PIPE)
-    process.wait(5)
-    version = re.match(rb".*?(\d+)\.\d+\.\d+\n", process.stdout.read())
-    parsed = [int(i) for i in version.groups()]
-
-    return parsed[0] < 4
-
-
-pytestmark = pytest.mark.skipif(
-    spamd_lt_4(),
-    reason="Only SpamAssassin 4+ supports client certificate authentication",
-)
-
-
-@pytest.mark.integration
-async def test_check_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
-):
-    result = await aiospamc.check(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_key_path),
-    )
-
-    assert 0 == result.status_code
+pytestmark = pytest.mark.xdist_group("spamd_ssl_client")
 
 
 @pytest.mark.integration
-async def test_headers_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
+@pytest.mark.parametrize(
+    "func",
+    [
+        aiospamc.check,
+        aiospamc.headers,
+        aiospamc.process,
+        aiospamc.report,
+        aiospamc.report_if_spam,
+        aiospamc.symbols,
+    ],
+)
+async def test_functions_client_auth(
+    func, spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
 ):
-    result = await aiospamc.headers(
+    result = await func(
         spam,
         host=spamd_ssl_client[0],
         port=spamd_ssl_client[1],
@@ -71,66 +45,6 @@ async def test_ping_client_auth(
     assert 0 == result.status_code
 
 
-@pytest.mark.integration
-async def test_process_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
-):
-    result = await aiospamc.process(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_key_path),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
-):
-    result = await aiospamc.report(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_key_path),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report_if_spam_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
-):
-    result = await aiospamc.report_if_spam(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_key_path),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_symbols_client_auth(
-    spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
-):
-    result = await aiospamc.symbols(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_key_path),
-    )
-
-    assert 0 == result.status_code
-
-
 @pytest.mark.integration
 async def test_tell_client_auth(
     spamd_ssl_client, ca_cert_path, client_cert_path, client_key_path, spam
@@ -148,27 +62,19 @@ async def test_tell_client_auth(
 
 
 @pytest.mark.integration
-async def test_check_client_encrypted(
-    spamd_ssl_client,
-    ca_cert_path,
-    client_cert_path,
-    client_encrypted_key_path,
-    client_private_key_password,
-    spam,
-):
-    result = await aiospamc.check(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_encrypted_key_path, client_private_key_password),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_headers_client_encrypted(
+@pytest.mark.parametrize(
+    "func",
+    [
+        aiospamc.check,
+        aiospamc.headers,
+        aiospamc.process,
+        aiospamc.report,
+        aiospamc.report_if_spam,
+        aiospamc.symbols,
+    ],
+)
+async def test_functions_client_encrypted(
+    func,
     spamd_ssl_client,
     ca_cert_path,
     client_cert_path,
@@ -176,7 +82,7 @@ async def test_headers_client_encrypted(
     client_private_key_password,
     spam,
 ):
-    result = await aiospamc.headers(
+    result = await func(
         spam,
         host=spamd_ssl_client[0],
         port=spamd_ssl_client[1],
@@ -205,86 +111,6 @@ async def test_ping_client_encrypted(
     assert 0 == result.status_code
 
 
-@pytest.mark.integration
-async def test_process_client_encrypted(
-    spamd_ssl_client,
-    ca_cert_path,
-    client_cert_path,
-    client_encrypted_key_path,
-    client_private_key_password,
-    spam,
-):
-    result = await aiospamc.process(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_encrypted_key_path, client_private_key_password),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report_client_encrypted(
-    spamd_ssl_client,
-    ca_cert_path,
-    client_cert_path,
-    client_encrypted_key_path,
-    client_private_key_password,
-    spam,
-):
-    result = await aiospamc.report(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_encrypted_key_path, client_private_key_password),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_report_if_spam_client_encrypted(
-    spamd_ssl_client,
-    ca_cert_path,
-    client_cert_path,
-    client_encrypted_key_path,
-    client_private_key_password,
-    spam,
-):
-    result = await aiospamc.report_if_spam(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_encrypted_key_path, client_private_key_password),
-    )
-
-    assert 0 == result.status_code
-
-
-@pytest.mark.integration
-async def test_symbols_client_encrypted(
-    spamd_ssl_client,
-    ca_cert_path,
-    client_cert_path,
-    client_encrypted_key_path,
-    client_private_key_password,
-    spam,
-):
-    result = await aiospamc.symbols(
-        spam,
-        host=spamd_ssl_client[0],
-        port=spamd_ssl_client[1],
-        verify=ca_cert_path,
-        cert=(client_cert_path, client_encrypted_key_path, client_private_key_password),
-    )
-
-    assert 0 == result.status_code
-
-
 @pytest.mark.integration
 async def test_tell_client_encrypted(
     spamd_ssl_client,
@@ -2,6 +2,8 @@ import pytest
 
 import aiospamc
 
+pytestmark = pytest.mark.xdist_group("spamd_tcp")
+
 
 @pytest.mark.integration
 async def test_check(spamd_tcp, spam):
@@ -4,9 +4,12 @@ import pytest
 
 import aiospamc
 
-pytestmark = pytest.mark.skipif(
-    sys.platform == "win32", reason="Unix sockets not supported on Windows"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        sys.platform == "win32", reason="Unix sockets not supported on Windows"
+    ),
+    pytest.mark.xdist_group("spamd_unix"),
+]
 
 
 @pytest.mark.integration